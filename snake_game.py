@@ -1,7 +1,10 @@
 import pygame
 import random
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from itertools import islice
 
 # Initialize Pygame
 pygame.init()
@@ -27,6 +30,21 @@ GRID_HEIGHT = (SCREEN_HEIGHT // SCALED_TILE_SIZE) - PADDING_TILES
 GRID_WIDTH = max(GRID_WIDTH, 20)
 GRID_HEIGHT = max(GRID_HEIGHT, 15)
 
+# Playable area inside the walls: columns 1..PLAYABLE_X_END-1, rows 1..PLAYABLE_Y_END-1
+PLAYABLE_X_END = GRID_WIDTH - 1
+PLAYABLE_Y_END = GRID_HEIGHT
+
+# Screen pixel position of each grid column/row (the head can reach the walls)
+PX_X = tuple(PADDING_OFFSET + i * SCALED_TILE_SIZE for i in range(GRID_WIDTH + 1))
+PX_Y = tuple(PADDING_OFFSET + i * SCALED_TILE_SIZE for i in range(GRID_HEIGHT + 1))
+
+# Sidebar layout (vertical offsets from the sidebar top)
+SIDEBAR_TITLE_Y = 60  # Increased from 40 to add more space above SNAKE title
+SIDEBAR_CONTROLS_Y = 370  # Below the score and game stats
+
+# Longest the main loop sleeps waiting for input while paused or game over, in milliseconds
+IDLE_WAIT_MS = 100
+
 # Colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -38,29 +56,86 @@ PURPLE = (255, 0, 255)
 CYAN = (0, 255, 255)
 GREY = (128, 128, 128)
 
+# Loaded assets, shared by every game instance
+_image_cache = {}
+_sound_cache = {}
+_font_cache = {}
+
+def load_image(path):
+    """Load an image once and keep it in the display pixel format"""
+    image = _image_cache.get(path)
+    if image is None:
+        image = pygame.image.load(path).convert_alpha()
+        _image_cache[path] = image
+    return image
+
+def load_sound(path):
+    """Load a sound effect once"""
+    sound = _sound_cache.get(path)
+    if sound is None:
+        sound = pygame.mixer.Sound(path)
+        _sound_cache[path] = sound
+    return sound
+
+def load_font(path, size):
+    """Load a font once per path and size (None for the default font)"""
+    font = _font_cache.get((path, size))
+    if font is None:
+        font = pygame.font.Font(path, size)
+        _font_cache[(path, size)] = font
+    return font
+
 class Direction(Enum):
     UP = (0, -1)
     DOWN = (0, 1)
     LEFT = (-1, 0)
     RIGHT = (1, 0)
 
+OPPOSITE = {
+    Direction.UP: Direction.DOWN,
+    Direction.DOWN: Direction.UP,
+    Direction.LEFT: Direction.RIGHT,
+    Direction.RIGHT: Direction.LEFT
+}
+
+HEAD_SPRITES = {direction: f'snake_head_{direction.name.lower()}' for direction in Direction}
+
+# Sent when the window was uncovered or restored and its contents need repainting
+HANDLED_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.VIDEOEXPOSE)
+
+KEY_DIRECTIONS = {
+    pygame.K_UP: Direction.UP,
+    pygame.K_DOWN: Direction.DOWN,
+    pygame.K_LEFT: Direction.LEFT,
+    pygame.K_RIGHT: Direction.RIGHT
+}
+
 class SnakeGame:
     def __init__(self):
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN)
         pygame.display.set_caption("Snake Game")
+        
+        # Only queue the events we handle (no mouse motion spam)
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENTS)
         self.clock = pygame.time.Clock()
         
-        # Load tileset
-        self.tileset = pygame.image.load("assets/tileset.png")
+        # Load tileset and scale it up once
+        self.tileset = load_image("assets/tileset.png")
+        self.scaled_tileset = self.scale_tileset()
         
         # Extract sprites from tileset (8x8 pixels each)
         self.sprites = self.extract_sprites()
         
+        # Walls never change, so render them once into the background
+        self.background = self.build_background()
+        
         # Game state
         self.snake = Snake(GRID_WIDTH // 2, GRID_HEIGHT // 2)
-        self.food = Food(self.snake.body)
+        self.food = Food(self.snake)
         self.score = 0
         self.high_score = self.load_high_score()
+        self.io_executor = ThreadPoolExecutor(max_workers=1)  # Keeps file I/O off the game loop
         self.game_over = False
         self.paused = True  # Start in paused state
         self.game_started = False  # Track if game has been started
@@ -73,43 +148,88 @@ class SnakeGame:
         self.food_per_level = 3  # Food needed to increase FPS
         self.current_fps = self.base_fps
         
-        # Load sound effects
-        try:
-            self.food_sound = pygame.mixer.Sound("assets/sound_effects/food.wav")
-            self.pause_sound = pygame.mixer.Sound("assets/sound_effects/pause.wav")
-        except:
-            self.food_sound = None
-            self.pause_sound = None
+        # FPS for each level (food_count // food_per_level), capped at max_fps
+        max_level = -(-(self.max_fps - self.base_fps) // self.fps_increment)  # First level at max_fps
+        self.fps_table = [min(self.base_fps + level * self.fps_increment, self.max_fps) for level in range(max_level + 1)]
+        
+        # Input and drawing run at a fixed frame rate, independent of the snake's speed
+        self.frame_rate = 60
+        self.step_time = 0  # Milliseconds accumulated towards the next snake move
+        
+        # Load sound effects in the background; they stay silent until loaded
+        self.food_sound = None
+        self.pause_sound = None
+        self.io_executor.submit(self.load_sounds)
         
         # Load fonts
         try:
-            self.font_large = pygame.font.Font("assets/fonts/PixelifySans-Bold.ttf", 48)
-            self.font_medium = pygame.font.Font("assets/fonts/PixelifySans-SemiBold.ttf", 36)
-            self.font_small = pygame.font.Font("assets/fonts/PixelifySans-Medium.ttf", 24)
-            self.font_tiny = pygame.font.Font("assets/fonts/PixelifySans-Regular.ttf", 18)
-            self.font_huge = pygame.font.Font("assets/fonts/PixelifySans-Bold.ttf", 72)  # Extra large for game over
-        except:
+            self.font_large = load_font("assets/fonts/PixelifySans-Bold.ttf", 48)
+            self.font_medium = load_font("assets/fonts/PixelifySans-SemiBold.ttf", 36)
+            self.font_small = load_font("assets/fonts/PixelifySans-Medium.ttf", 24)
+            self.font_tiny = load_font("assets/fonts/PixelifySans-Regular.ttf", 18)
+            self.font_huge = load_font("assets/fonts/PixelifySans-Bold.ttf", 72)  # Extra large for game over
+        except (pygame.error, OSError):
             # Fallback to default fonts if custom fonts fail to load
-            self.font_large = pygame.font.Font(None, 48)
-            self.font_medium = pygame.font.Font(None, 36)
-            self.font_small = pygame.font.Font(None, 24)
-            self.font_tiny = pygame.font.Font(None, 18)
-            self.font_huge = pygame.font.Font(None, 72)
+            self.font_large = load_font(None, 48)
+            self.font_medium = load_font(None, 36)
+            self.font_small = load_font(None, 24)
+            self.font_tiny = load_font(None, 18)
+            self.font_huge = load_font(None, 72)
+        
+        # Sidebar background, title and controls never change
+        self.controls_block = self.build_controls_block()
+        self.sidebar_static = self.build_sidebar_static()
+        self.sidebar_cache = self.sidebar_static.copy()
+        self.sidebar_state = None  # Values shown in sidebar_cache
+        self.sidebar_stats_rect = None  # Area of sidebar_cache covered by those values
+        
+        # Overlay messages never change, so render them once as (surface, position)
+        self.overlay_game_over = self.build_overlay([
+            (self.font_huge, "GAME OVER", RED, -30),  # Red huge font
+            (self.font_medium, "Press SPACE to restart", GREY, 30)  # Grey smaller font
+        ])
+        self.overlay_win = self.build_overlay([
+            (self.font_huge, "YOU WIN!", GREEN, -30),
+            (self.font_medium, "Press SPACE to restart", GREY, 30)
+        ])
+        self.overlay_start = self.build_overlay([(self.font_large, "Press SPACE to start", GREEN, 0)])
+        self.overlay_pause = self.build_overlay([(self.font_large, "PAUSED - Press SPACE to continue", GREEN, 0)])
+        self.overlay = self.overlay_start  # Message for the current state, swapped on state changes
+        
+        # What is currently on screen, so frames can redraw only what changed
+        self.needs_full_redraw = True
+        self.needs_redraw = False  # Set when the snake, food or sidebar changed
+        self.drawn_food = None
+        self.drawn_overlay = None
+    
+    def load_sounds(self):
+        """Load sound effects, leaving them as None if they can't be loaded"""
+        try:
+            food_sound = load_sound("assets/sound_effects/food.wav")
+            pause_sound = load_sound("assets/sound_effects/pause.wav")
+        except (pygame.error, OSError):
+            return
+        self.food_sound = food_sound
+        self.pause_sound = pause_sound
     
     def load_high_score(self):
         """Load high score from file"""
         try:
             with open("high_score.txt", "r") as f:
                 return int(f.read().strip())
-        except:
+        except (OSError, ValueError):
             return 0
     
     def save_high_score(self):
-        """Save high score to file"""
+        """Save high score to file in the background"""
+        self.io_executor.submit(self.write_high_score, self.high_score)
+    
+    def write_high_score(self, high_score):
+        """Write high score to file"""
         try:
             with open("high_score.txt", "w") as f:
-                f.write(str(self.high_score))
-        except:
+                f.write(str(high_score))
+        except OSError:
             pass
     
     def extract_sprites(self):
@@ -137,51 +257,65 @@ class SnakeGame:
         
         return sprites
     
+    def scale_tileset(self):
+        """Scale the whole tileset once, with black made transparent"""
+        width, height = self.tileset.get_size()
+        tileset = pygame.Surface((width, height))
+        tileset.blit(self.tileset, (0, 0))
+        tileset = pygame.transform.scale(tileset, (width * SCALE, height * SCALE))
+        tileset.set_colorkey((0, 0, 0))  # Make black transparent
+        return tileset.convert_alpha()  # Match display format for fast blits
+    
     def get_sprite(self, col, row):
-        """Extract a sprite from the tileset at given column and row"""
-        x = col * TILE_SIZE
-        y = row * TILE_SIZE
-        sprite = pygame.Surface((TILE_SIZE, TILE_SIZE))
-        sprite.blit(self.tileset, (0, 0), (x, y, TILE_SIZE, TILE_SIZE))
-        sprite = pygame.transform.scale(sprite, (SCALED_TILE_SIZE, SCALED_TILE_SIZE))
-        sprite.set_colorkey((0, 0, 0))  # Make black transparent
-        return sprite
+        """Extract a sprite from the scaled tileset at given column and row"""
+        x = col * SCALED_TILE_SIZE
+        y = row * SCALED_TILE_SIZE
+        # Subsurfaces share pixels with the scaled tileset, so no copy is made
+        return self.scaled_tileset.subsurface((x, y, SCALED_TILE_SIZE, SCALED_TILE_SIZE))
     
     def handle_events(self):
         """Handle pygame events"""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        # Pump SDL once per frame, then fetch only the event types we handle
+        pygame.event.pump()
+        for event in pygame.event.get(HANDLED_EVENTS, pump=False):
+            if not self.handle_event(event):
+                return False
+        return True
+    
+    def handle_event(self, event):
+        """Handle a single pygame event, returning False to quit"""
+        if event.type == pygame.QUIT:
+            return False
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
                 return False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    return False
-                elif event.key == pygame.K_F11:
-                    # Toggle fullscreen
-                    if self.screen.get_flags() & pygame.FULLSCREEN:
-                        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-                    else:
-                        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN)
-                elif event.key == pygame.K_SPACE:
-                    if self.game_over:
-                        self.restart_game()
-                    elif not self.game_started:
-                        # Start the game for the first time
-                        self.game_started = True
-                        self.paused = False
-                    else:
-                        # Toggle pause during gameplay
-                        self.paused = not self.paused
-                        if self.pause_sound:
-                            self.pause_sound.play()
-                elif not self.game_over and not self.paused:
-                    if event.key == pygame.K_UP:
-                        self.snake.set_direction(Direction.UP)
-                    elif event.key == pygame.K_DOWN:
-                        self.snake.set_direction(Direction.DOWN)
-                    elif event.key == pygame.K_LEFT:
-                        self.snake.set_direction(Direction.LEFT)
-                    elif event.key == pygame.K_RIGHT:
-                        self.snake.set_direction(Direction.RIGHT)
+            elif event.key == pygame.K_F11:
+                # Toggle fullscreen
+                if self.screen.get_flags() & pygame.FULLSCREEN:
+                    self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+                else:
+                    self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN)
+                self.needs_full_redraw = True
+            elif event.key == pygame.K_SPACE:
+                if self.game_over:
+                    self.restart_game()
+                elif not self.game_started:
+                    # Start the game for the first time
+                    self.game_started = True
+                    self.paused = False
+                    self.overlay = None
+                else:
+                    # Toggle pause during gameplay
+                    self.paused = not self.paused
+                    self.overlay = self.overlay_pause if self.paused else None
+                    if self.pause_sound:
+                        self.pause_sound.play()
+            elif not self.game_over and not self.paused:
+                direction = KEY_DIRECTIONS.get(event.key)
+                if direction is not None:
+                    self.snake.set_direction(direction)
+        elif event.type == pygame.VIDEOEXPOSE:
+            self.needs_full_redraw = True
         return True
     
     def update(self):
@@ -190,18 +324,14 @@ class SnakeGame:
             return
         
         # Move snake
-        self.snake.move()
+        head = self.snake.move()
+        self.needs_redraw = True
         
-        # Check wall collision
-        head = self.snake.body[0]
-        if (head[0] < 1 or head[0] >= GRID_WIDTH - 1 or 
-            head[1] < 1 or head[1] > GRID_HEIGHT - 1):
-            self.game_over = True
-            return
-        
-        # Check self collision
-        if head in self.snake.body[1:]:
+        # Check wall and self collision
+        x, y = head
+        if not (1 <= x < PLAYABLE_X_END and 1 <= y < PLAYABLE_Y_END) or self.snake.hit_self:
             self.game_over = True
+            self.overlay = self.overlay_game_over
             return
         
         # Check food collision
@@ -211,242 +341,386 @@ class SnakeGame:
             self.food_count += 1
             
             # Increase FPS every 3 food intakes
-            if self.food_count % self.food_per_level == 0 and self.current_fps < self.max_fps:
-                self.current_fps = min(self.current_fps + self.fps_increment, self.max_fps)
+            level = self.food_count // self.food_per_level
+            self.current_fps = self.fps_table[min(level, len(self.fps_table) - 1)]
             
             if self.score > self.high_score:
                 self.high_score = self.score
                 self.save_high_score()
             if self.food_sound:
                 self.food_sound.play()
-            self.food = Food(self.snake.body)
+            if not self.snake.free_cells:
+                # The snake fills the board, so there is nowhere left for food
+                self.game_over = True
+                self.overlay = self.overlay_win
+                return
+            self.food = Food(self.snake)
     
-    def draw_walls(self):
-        """Draw the wall boundaries"""
-        offset_x = PADDING_OFFSET
-        offset_y = PADDING_OFFSET
+    def build_wall_strip(self, sprite_name, length, horizontal):
+        """Tile a wall sprite into a single horizontal or vertical strip"""
+        if horizontal:
+            size = (length * SCALED_TILE_SIZE, SCALED_TILE_SIZE)
+            positions = [(i * SCALED_TILE_SIZE, 0) for i in range(length)]
+        else:
+            size = (SCALED_TILE_SIZE, length * SCALED_TILE_SIZE)
+            positions = [(0, i * SCALED_TILE_SIZE) for i in range(length)]
+        
+        strip = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+        sprite = self.sprites[sprite_name]
+        strip.blits([(sprite, position) for position in positions], doreturn=0)
+        return strip
+    
+    def build_wall_layer(self):
+        """Pre-render the static wall boundaries and the black play area into a single surface"""
+        # Opaque, so drawing it is a plain copy with no per-pixel alpha blending
+        wall_layer = pygame.Surface((GRID_WIDTH * SCALED_TILE_SIZE, (GRID_HEIGHT + 1) * SCALED_TILE_SIZE)).convert()
+        wall_layer.fill(BLACK)
         
-        # Top wall
-        for x in range(1, GRID_WIDTH - 1):
-            self.screen.blit(self.sprites['wall_top'], (offset_x + x * SCALED_TILE_SIZE, offset_y))
+        # Top and bottom walls
+        wall_layer.blit(self.build_wall_strip('wall_top', GRID_WIDTH - 2, True), (SCALED_TILE_SIZE, 0))
+        wall_layer.blit(self.build_wall_strip('wall_bottom', GRID_WIDTH - 2, True), (SCALED_TILE_SIZE, GRID_HEIGHT * SCALED_TILE_SIZE))
         
-        # Bottom wall
-        for x in range(1, GRID_WIDTH - 1):
-            self.screen.blit(self.sprites['wall_bottom'], (offset_x + x * SCALED_TILE_SIZE, offset_y + GRID_HEIGHT * SCALED_TILE_SIZE))
+        # Left and right walls
+        wall_layer.blit(self.build_wall_strip('wall_left', GRID_HEIGHT - 1, False), (0, SCALED_TILE_SIZE))
+        wall_layer.blit(self.build_wall_strip('wall_right', GRID_HEIGHT - 1, False), ((GRID_WIDTH - 1) * SCALED_TILE_SIZE, SCALED_TILE_SIZE))
         
-        # Left wall
-        for y in range(1, GRID_HEIGHT):
-            self.screen.blit(self.sprites['wall_left'], (offset_x, offset_y + y * SCALED_TILE_SIZE))
+        # Corners
+        wall_layer.blit(self.sprites['wall_tl'], (0, 0))
+        wall_layer.blit(self.sprites['wall_tr'], ((GRID_WIDTH - 1) * SCALED_TILE_SIZE, 0))
+        wall_layer.blit(self.sprites['wall_tl'], (0, GRID_HEIGHT * SCALED_TILE_SIZE))
+        wall_layer.blit(self.sprites['wall_tr'], ((GRID_WIDTH - 1) * SCALED_TILE_SIZE, GRID_HEIGHT * SCALED_TILE_SIZE))
         
-        # Right wall
-        for y in range(1, GRID_HEIGHT):
-            self.screen.blit(self.sprites['wall_right'], (offset_x + (GRID_WIDTH - 1) * SCALED_TILE_SIZE, offset_y + y * SCALED_TILE_SIZE))
+        return wall_layer
+    
+    def build_background(self):
+        """Pre-render the whole screen background, walls included"""
+        background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        background.fill(BLACK)
+        background.blit(self.build_wall_layer(), (PADDING_OFFSET, PADDING_OFFSET))
+        return background
+    
+    def build_controls_block(self):
+        """Pre-render the controls list as one surface, returned with its position in the sidebar"""
+        controls = [
+            "CONTROLS:",
+            "Arrow Keys Move",
+            "SPACE Pause",
+            "F11 Fullscreen",
+            "ESC Quit"
+        ]
         
-        # Corners
-        self.screen.blit(self.sprites['wall_tl'], (offset_x, offset_y))
-        self.screen.blit(self.sprites['wall_tr'], (offset_x + (GRID_WIDTH - 1) * SCALED_TILE_SIZE, offset_y))
-        self.screen.blit(self.sprites['wall_tl'], (offset_x, offset_y + GRID_HEIGHT * SCALED_TILE_SIZE))
-        self.screen.blit(self.sprites['wall_tr'], (offset_x + (GRID_WIDTH - 1) * SCALED_TILE_SIZE, offset_y + GRID_HEIGHT * SCALED_TILE_SIZE))
+        lines = []
+        y_offset = SIDEBAR_CONTROLS_Y
+        for i, control in enumerate(controls):
+            if i == 0:  # Title
+                control_text = self.font_small.render(control, True, GREY)
+            else:  # Individual controls
+                control_text = self.font_tiny.render(control, True, GREY)
+            lines.append((control_text, control_text.get_rect(center=((SIDEBAR_WIDTH_PX) // 2, y_offset))))
+            y_offset += 25
+        
+        block_rect = lines[0][1].unionall([rect for _, rect in lines[1:]])
+        controls_block = pygame.Surface(block_rect.size).convert()
+        controls_block.fill(BLACK)
+        for control_text, rect in lines:
+            controls_block.blit(control_text, rect.move(-block_rect.x, -block_rect.y))
+        return controls_block, block_rect.topleft
     
-    def draw_sidebar(self):
-        """Draw the sidebar with game information"""
-        sidebar_x = (2 + GRID_WIDTH + 2) * SCALED_TILE_SIZE  # Start after game area with 2 tiles gap (same as left padding)
-        sidebar_y = 2 * SCALED_TILE_SIZE  # Same as game area top
+    def build_sidebar_static(self):
+        """Pre-render the parts of the sidebar that never change"""
         sidebar_height = (GRID_HEIGHT + 1) * SCALED_TILE_SIZE  # Same height as walls (from top padding to bottom wall)
+        sidebar_static = pygame.Surface((SIDEBAR_WIDTH_PX, sidebar_height)).convert()
         
         # Draw sidebar background
-        sidebar_rect = pygame.Rect(sidebar_x, sidebar_y, SIDEBAR_WIDTH_PX, sidebar_height)
-        pygame.draw.rect(self.screen, BLACK, sidebar_rect)
-        pygame.draw.rect(self.screen, WHITE, sidebar_rect, 2)
-        
-        # Draw game information
-        y_offset = 60  # Increased from 40 to add more space above SNAKE title
+        sidebar_rect = sidebar_static.get_rect()
+        pygame.draw.rect(sidebar_static, BLACK, sidebar_rect)
+        pygame.draw.rect(sidebar_static, WHITE, sidebar_rect, 2)
         
         # Title - each letter in different color
         title_colors = [RED, BLUE, GREEN, PURPLE, CYAN]
         title_letters = ["S", "N", "A", "K", "E"]
         letter_spacing = 32  # Increased spacing between letters
         total_width = (len(title_letters) - 1) * letter_spacing
-        title_x = sidebar_x + (SIDEBAR_WIDTH_PX) // 2 - total_width // 2  # Center the word
+        title_x = (SIDEBAR_WIDTH_PX) // 2 - total_width // 2  # Center the word
         
         for i, (letter, color) in enumerate(zip(title_letters, title_colors)):
             letter_text = self.font_large.render(letter, True, color)
-            letter_rect = letter_text.get_rect(center=(title_x + i * letter_spacing, sidebar_y + y_offset))
-            self.screen.blit(letter_text, letter_rect)
-        y_offset += 60
+            letter_rect = letter_text.get_rect(center=(title_x + i * letter_spacing, SIDEBAR_TITLE_Y))
+            sidebar_static.blit(letter_text, letter_rect)
+        
+        # Controls
+        sidebar_static.blit(*self.controls_block)
+        
+        return sidebar_static
+    
+    def build_overlay(self, lines):
+        """Pre-render centered message lines of (font, text, color, y offset) on a black background"""
+        texts = []
+        for font, text, color, dy in lines:
+            text_surface = font.render(text, True, color)
+            texts.append((text_surface, text_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + dy))))
+        
+        # Black background for all texts
+        combined_rect = texts[0][1].unionall([rect for _, rect in texts[1:]])
+        bg_rect = combined_rect.inflate(20, 10)  # Add padding around text
+        overlay = pygame.Surface(bg_rect.size).convert()
+        overlay.fill(BLACK)
+        
+        for text_surface, rect in texts:
+            overlay.blit(text_surface, rect.move(-bg_rect.x, -bg_rect.y))
+        return overlay, bg_rect.topleft
+    
+    def render_sidebar(self):
+        """Render the sidebar, including the current game information, into its cache"""
+        sidebar = self.sidebar_cache
+        center_x = (SIDEBAR_WIDTH_PX) // 2
+        
+        # Draw background, title and controls
+        sidebar.blit(self.sidebar_static, (0, 0))
+        
+        # Draw game information
+        y_offset = SIDEBAR_TITLE_Y + 60
         
         # Current Score
         score_text = self.font_medium.render(f"Score: {self.score}", True, YELLOW)
-        score_rect = score_text.get_rect(center=(sidebar_x + (SIDEBAR_WIDTH_PX) // 2, sidebar_y + y_offset))
-        self.screen.blit(score_text, score_rect)
+        score_rect = score_text.get_rect(center=(center_x, y_offset))
+        sidebar.blit(score_text, score_rect)
         y_offset += 40
         
         # High Score
         high_score_text = self.font_medium.render(f"High: {self.high_score}", True, YELLOW)
-        high_score_rect = high_score_text.get_rect(center=(sidebar_x + (SIDEBAR_WIDTH_PX) // 2, sidebar_y + y_offset))
-        self.screen.blit(high_score_text, high_score_rect)
+        high_score_rect = high_score_text.get_rect(center=(center_x, y_offset))
+        sidebar.blit(high_score_text, high_score_rect)
         y_offset += 60
         
         # Snake Length
         length_text = self.font_small.render(f"Length: {len(self.snake.body)}", True, WHITE)
-        length_rect = length_text.get_rect(center=(sidebar_x + (SIDEBAR_WIDTH_PX) // 2, sidebar_y + y_offset))
-        self.screen.blit(length_text, length_rect)
+        length_rect = length_text.get_rect(center=(center_x, y_offset))
+        sidebar.blit(length_text, length_rect)
         y_offset += 30
         
         # Food Type
         food_type = "Cherry" if self.food.sprite_name == 'cherry' else "Cookie"
         food_text = self.font_small.render(f"Next: {food_type}", True, WHITE)
-        food_rect = food_text.get_rect(center=(sidebar_x + (SIDEBAR_WIDTH_PX) // 2, sidebar_y + y_offset))
-        self.screen.blit(food_text, food_rect)
+        food_rect = food_text.get_rect(center=(center_x, y_offset))
+        sidebar.blit(food_text, food_rect)
         y_offset += 30
         
         # Points Value
         points_text = self.font_small.render(f"Worth: {self.food.points}", True, WHITE)
-        points_rect = points_text.get_rect(center=(sidebar_x + (SIDEBAR_WIDTH_PX) // 2, sidebar_y + y_offset))
-        self.screen.blit(points_text, points_rect)
+        points_rect = points_text.get_rect(center=(center_x, y_offset))
+        sidebar.blit(points_text, points_rect)
         y_offset += 30
         
         # Current Speed
         speed_text = self.font_small.render(f"Speed: {self.current_fps} FPS", True, WHITE)
-        speed_rect = speed_text.get_rect(center=(sidebar_x + (SIDEBAR_WIDTH_PX) // 2, sidebar_y + y_offset))
-        self.screen.blit(speed_text, speed_rect)
-        y_offset += 60
-        
-        # Controls
-        controls = [
-            "CONTROLS:",
-            "Arrow Keys Move",
-            "SPACE Pause",
-            "F11 Fullscreen",
-            "ESC Quit"
-        ]
+        speed_rect = speed_text.get_rect(center=(center_x, y_offset))
+        sidebar.blit(speed_text, speed_rect)
         
-        for i, control in enumerate(controls):
-            if i == 0:  # Title
-                control_text = self.font_small.render(control, True, GREY)
-            else:  # Individual controls
-                control_text = self.font_tiny.render(control, True, GREY)
-            control_rect = control_text.get_rect(center=(sidebar_x + (SIDEBAR_WIDTH_PX) // 2, sidebar_y + y_offset))
-            self.screen.blit(control_text, control_rect)
-            y_offset += 25
+        # Area covered by the game information
+        self.sidebar_stats_rect = score_rect.unionall([high_score_rect, length_rect, food_rect, points_rect, speed_rect])
+    
+    def update_sidebar(self):
+        """Re-render the sidebar cache if a displayed value changed, returning the area that changed"""
+        state = (self.score, self.high_score, len(self.snake.body), self.food.sprite_name, self.current_fps)
+        if state == self.sidebar_state:
+            return None
+        previous_stats_rect = self.sidebar_stats_rect
+        self.render_sidebar()
+        self.sidebar_state = state
+        
+        # Cover both the old and the new text, which may be wider
+        changed_rect = self.sidebar_stats_rect
+        if previous_stats_rect:
+            changed_rect = changed_rect.union(previous_stats_rect)
+        return changed_rect.clip(self.sidebar_cache.get_rect())
+    
+    def draw_sidebar(self, area=None):
+        """Draw the sidebar (or just an area of it) and return the screen area it covers"""
+        sidebar_x = (2 + GRID_WIDTH + 2) * SCALED_TILE_SIZE  # Start after game area with 2 tiles gap (same as left padding)
+        sidebar_y = 2 * SCALED_TILE_SIZE  # Same as game area top
+        if area:
+            return self.screen.blit(self.sidebar_cache, (sidebar_x + area.x, sidebar_y + area.y), area)
+        return self.screen.blit(self.sidebar_cache, (sidebar_x, sidebar_y))
+    
+    def get_cell_sprite(self, cell):
+        """Return the name of the sprite at a grid cell, or None if it is empty"""
+        if cell == self.snake.body[0]:
+            return self.snake.head_sprite
+        if cell in self.snake.body_set:
+            return 'snake_body'
+        if cell == self.food.position:
+            return self.food.sprite_name
+        return None
+    
+    def draw_changes(self, overlay):
+        """Redraw only the grid cells and sidebar that changed since the last frame"""
+        # Cells touched by the snake's moves, plus the old and new food when it respawned
+        cells = set(self.snake.changed_cells)
+        self.snake.changed_cells.clear()
+        if self.food is not self.drawn_food:
+            cells.add(self.drawn_food.position)
+            cells.add(self.food.position)
+            self.drawn_food = self.food
+        
+        dirty = []
+        for cell in cells:
+            rect = pygame.Rect(PX_X[cell[0]], PX_Y[cell[1]], SCALED_TILE_SIZE, SCALED_TILE_SIZE)
+            self.screen.blit(self.background, rect, rect)
+            sprite_name = self.get_cell_sprite(cell)
+            if sprite_name:
+                self.screen.blit(self.sprites[sprite_name], rect)
+            dirty.append(rect)
+        
+        sidebar_area = self.update_sidebar()
+        if sidebar_area:
+            dirty.append(self.draw_sidebar(sidebar_area))
+        
+        # Keep the message on top of anything redrawn underneath it
+        if overlay and dirty:
+            dirty.append(self.screen.blit(*overlay))
+        
+        pygame.display.update(dirty)
     
     def draw(self):
         """Draw the game"""
-        self.screen.fill(BLACK)
+        overlay = self.overlay
+        
+        # Only the snake, food and sidebar change between frames with the same overlay,
+        # and they only change when the snake moves
+        if not self.needs_full_redraw and overlay is self.drawn_overlay:
+            if self.needs_redraw:
+                self.draw_changes(overlay)
+                self.needs_redraw = False
+            return
         
-        # Draw walls
-        self.draw_walls()
+        # Draw background and walls
+        self.screen.blit(self.background, (0, 0))
         
         # Draw food
-        offset_x = PADDING_OFFSET
-        offset_y = PADDING_OFFSET
-        food_x = offset_x + self.food.position[0] * SCALED_TILE_SIZE
-        food_y = offset_y + self.food.position[1] * SCALED_TILE_SIZE
-        self.screen.blit(self.sprites[self.food.sprite_name], (food_x, food_y))
-        
-        # Draw snake
-        for i, segment in enumerate(self.snake.body):
-            x = offset_x + segment[0] * SCALED_TILE_SIZE
-            y = offset_y + segment[1] * SCALED_TILE_SIZE
-            
-            if i == 0:  # Head
-                head_sprite = f'snake_head_{self.snake.direction.name.lower()}'
-                self.screen.blit(self.sprites[head_sprite], (x, y))
-            else:  # Body
-                self.screen.blit(self.sprites['snake_body'], (x, y))
+        self.screen.blit(self.sprites[self.food.sprite_name], self.food.pixel_pos)
+        
+        # Draw snake (head first, then body) in a single batched call
+        head = self.snake.body[0]
+        body_sprite = self.sprites['snake_body']
+        blit_list = [(self.sprites[self.snake.head_sprite], (PX_X[head[0]], PX_Y[head[1]]))]
+        blit_list.extend((body_sprite, (PX_X[x], PX_Y[y])) for x, y in islice(self.snake.body, 1, None))
+        self.screen.blits(blit_list, doreturn=0)
         
         # Draw sidebar
+        self.update_sidebar()
         self.draw_sidebar()
         
         # Draw game over/pause/start messages
-        if self.game_over:
-            # "GAME OVER" in red huge font
-            game_over_text = self.font_huge.render("GAME OVER", True, RED)
-            game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 30))
-            
-            # "Press SPACE to restart" in grey smaller font
-            restart_text = self.font_medium.render("Press SPACE to restart", True, GREY)
-            restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 30))
-            
-            # Draw black background for both texts
-            combined_rect = pygame.Rect.union(game_over_rect, restart_rect)
-            bg_rect = combined_rect.inflate(20, 10)  # Add padding around text
-            pygame.draw.rect(self.screen, BLACK, bg_rect)
-            
-            # Draw both texts
-            self.screen.blit(game_over_text, game_over_rect)
-            self.screen.blit(restart_text, restart_rect)
-        elif self.paused and not self.game_started:
-            start_text = self.font_large.render("Press SPACE to start", True, GREEN)
-            text_rect = start_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-            # Draw black background
-            bg_rect = text_rect.inflate(20, 10)  # Add padding around text
-            pygame.draw.rect(self.screen, BLACK, bg_rect)
-            self.screen.blit(start_text, text_rect)
-        elif self.paused and self.game_started:
-            pause_text = self.font_large.render("PAUSED - Press SPACE to continue", True, GREEN)
-            text_rect = pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-            # Draw black background
-            bg_rect = text_rect.inflate(20, 10)  # Add padding around text
-            pygame.draw.rect(self.screen, BLACK, bg_rect)
-            self.screen.blit(pause_text, text_rect)
+        if overlay:
+            self.screen.blit(*overlay)
         
         pygame.display.flip()
+        self.needs_full_redraw = False
+        self.needs_redraw = False
+        self.snake.changed_cells.clear()
+        self.drawn_food = self.food
+        self.drawn_overlay = overlay
     
     def restart_game(self):
         """Restart the game"""
         self.snake = Snake(GRID_WIDTH // 2, GRID_HEIGHT // 2)
-        self.food = Food(self.snake.body)
+        self.food = Food(self.snake)
         self.score = 0
         self.game_over = False
         self.paused = True  # Start paused after restart
         self.game_started = False  # Reset game started state
+        self.overlay = self.overlay_start
+        self.needs_full_redraw = True  # New snake and food, so no deltas to replay
         
         # Reset FPS system
         self.food_count = 0
         self.current_fps = self.base_fps
     
+    def advance(self, dt):
+        """Move the snake once if a step interval has elapsed after dt more milliseconds"""
+        if self.game_over or self.paused:
+            self.step_time = 0
+            return
+        
+        self.step_time += dt
+        step_interval = 1000 / self.current_fps  # Dynamic FPS that increases with food intake
+        if self.step_time >= step_interval:
+            # Carry the remainder so the average speed matches current_fps, but cap the
+            # backlog at one move so a long frame never replays missed moves unseen
+            self.step_time = min(self.step_time - step_interval, step_interval)
+            self.update()
+    
     def run(self):
         """Main game loop"""
         running = True
         while running:
-            running = self.handle_events()
-            self.update()
+            if self.paused or self.game_over:
+                # Nothing moves, so sleep until input arrives instead of ticking
+                event = pygame.event.wait(IDLE_WAIT_MS)
+                if event.type != pygame.NOEVENT:
+                    running = self.handle_event(event)
+                self.clock.tick()  # Drop the idle time so it isn't replayed as steps
+                dt = 0
+            else:
+                dt = self.clock.tick(self.frame_rate)
+            running = running and self.handle_events()
+            self.advance(dt)
             self.draw()
-            self.clock.tick(self.current_fps)  # Dynamic FPS that increases with food intake
         
+        self.io_executor.shutdown(wait=True)  # Flush the last high score write
         pygame.quit()
         sys.exit()
 
 class Snake:
     def __init__(self, x, y):
-        self.body = [(x, y), (x - 1, y)]  # Start with head and one body segment
+        self.body = deque([(x, y), (x - 1, y)])  # Start with head and one body segment
+        self.body_set = set(self.body)  # Occupied cells for O(1) lookups
+        # Empty cells inside the walls, for placing food, with each cell's index in the list
+        self.free_cells = [(cx, cy) for cx in range(1, PLAYABLE_X_END) for cy in range(1, PLAYABLE_Y_END)
+                           if (cx, cy) not in self.body_set]
+        self.free_index = {cell: i for i, cell in enumerate(self.free_cells)}
+        self.hit_self = False  # Whether the last move ran into the body
+        self.changed_cells = []  # Cells whose sprite changed since the last draw
         self.direction = Direction.RIGHT
         self.next_direction = Direction.RIGHT  # Queue for next direction change
+        self.direction_vec = self.direction.value  # (dx, dy) of the current direction
+        self.head_sprite = HEAD_SPRITES[self.direction]  # Sprite name for the current direction
     
     def move(self):
-        """Move the snake in the current direction"""
+        """Move the snake in the current direction and return the new head"""
         # Apply queued direction change if valid
-        if self.can_change_direction(self.next_direction):
+        if self.next_direction is not self.direction and self.can_change_direction(self.next_direction):
             self.direction = self.next_direction
+            self.direction_vec = self.direction.value
+            self.head_sprite = HEAD_SPRITES[self.direction]
         
         head = self.body[0]
-        new_head = (head[0] + self.direction.value[0], head[1] + self.direction.value[1])
-        self.body.insert(0, new_head)
-        self.body.pop()
+        dx, dy = self.direction_vec
+        new_head = (head[0] + dx, head[1] + dy)
+        self.body.appendleft(new_head)
+        tail = self.body.pop()
+        # After growing the tail cell is listed twice, so keep it occupied
+        if tail != self.body[-1]:
+            self.body_set.discard(tail)
+            self.add_free_cell(tail)
+            self.changed_cells.append(tail)
+        self.hit_self = new_head in self.body_set
+        self.body_set.add(new_head)
+        self.remove_free_cell(new_head)
+        self.changed_cells.append(head)  # Old head is now drawn as body
+        self.changed_cells.append(new_head)
+        return new_head
     
     def can_change_direction(self, new_direction):
         """Check if the snake can change to the new direction"""
         # Can't reverse direction
-        if (self.direction == Direction.UP and new_direction == Direction.DOWN) or \
-           (self.direction == Direction.DOWN and new_direction == Direction.UP) or \
-           (self.direction == Direction.LEFT and new_direction == Direction.RIGHT) or \
-           (self.direction == Direction.RIGHT and new_direction == Direction.LEFT):
-            return False
-        return True
+        return OPPOSITE[self.direction] is not new_direction
     
     def set_direction(self, new_direction):
         """Set the next direction for the snake"""
+        if new_direction is self.next_direction:
+            return  # Already queued
         if self.can_change_direction(new_direction):
             self.next_direction = new_direction
     
@@ -454,20 +728,32 @@ class Snake:
         """Grow the snake by one segment"""
         tail = self.body[-1]
         self.body.append(tail)
+    
+    def add_free_cell(self, cell):
+        """Mark a cell as free"""
+        self.free_index[cell] = len(self.free_cells)
+        self.free_cells.append(cell)
+    
+    def remove_free_cell(self, cell):
+        """Mark a cell as occupied in O(1) by moving the last free cell into its slot"""
+        index = self.free_index.pop(cell, None)
+        if index is None:
+            return
+        last = self.free_cells.pop()
+        if last != cell:
+            self.free_cells[index] = last
+            self.free_index[last] = index
 
 class Food:
-    def __init__(self, snake_body):
-        self.position = self.generate_position(snake_body)
+    def __init__(self, snake):
+        self.position = self.generate_position(snake)
+        self.pixel_pos = (PX_X[self.position[0]], PX_Y[self.position[1]])  # Screen position, fixed for the food's lifetime
         self.sprite_name = random.choice(['cherry', 'cookie'])
         self.points = 10 if self.sprite_name == 'cherry' else 20
     
-    def generate_position(self, snake_body):
+    def generate_position(self, snake):
         """Generate a random position not occupied by snake"""
-        while True:
-            x = random.randint(1, GRID_WIDTH - 2)
-            y = random.randint(1, GRID_HEIGHT - 1)
-            if (x, y) not in snake_body:
-                return (x, y)
+        return random.choice(snake.free_cells)
 
 if __name__ == "__main__":
     game = SnakeGame()